@@ -6,52 +6,120 @@ persistent_runner.py
 ✨ Text-prompt or Image-dir workflows  
 🗣️ On-the-fly Coqui TTS narration in Text mode (currently disabled)  
 📊 Live CPU/RAM & GPU/VRAM stats  
-🧹 Memory flushes before/after renders  
+🧹 Memory flushes before renders when VRAM runs low  
 🩺 FlashAttention health-check  
 🎞️ Auto-pad to even dims, mux audio/video  
 🔣 Numbered prompt picker  
 🚪 Explicit quit options  
-🔔 Beep when render completes  
+🔔 Desktop notification when render completes  
+📦 Unattended batch mode (--images-dir / --batch jobs.json)  
 """
 
 import sys
+import argparse
+import json
 import subprocess
 import shutil
 import gc
+import importlib
 import os
 import re
+import threading
+from collections import deque
+from io import BytesIO
 from pathlib import Path
 
-# Optional resource monitoring
+# Optional transcoding of mixed-format selections
 try:
-    import torch
-    import psutil
+    from PIL import Image
 except ImportError:
-    torch = None
-    psutil = None
+    Image = None
 
 # Toggle TTS narration on/off
 ENABLE_TTS = False
 
 # Supported image extensions
-IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".bmp", ".webp"}
+IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".bmp", ".webp"})
+# Lower, UPPER and Title case only; rarer mixes like ".JpG" are not matched
+IMAGE_EXTS_CI = frozenset(
+    e for ext in IMAGE_EXTS for e in (ext, ext.upper(), "." + ext[1:].capitalize())
+)
+# Decoder per extension; a selection sharing one codec can use the concat list
+FORMAT_CODECS = {
+    ".png": "png",
+    ".jpg": "mjpeg",
+    ".jpeg": "mjpeg",
+    ".bmp": "bmp",
+    ".webp": "webp",
+}
 IMG_ROOT = Path(r"D:\AI\1Video_Generator\images")
 
+# Heavy optional modules (torch, psutil) are imported on first use
+_optional_modules = {}
+
+# NVML handle for GPU 0, set up on first show_stats() (False if unavailable)
+_nvml_handle = None
+
+# In-flight desktop notifications, joined briefly before the process exits
+_notify_threads = []
+
+# Selection syntax: single indices or ranges, e.g. "1, 3-5"
+_SEL_RE = re.compile(r"(\d+)(?:\s*-\s*(\d+))?")
+
+# Only release cached VRAM when free memory drops below this fraction
+VRAM_FLUSH_THRESHOLD = 0.15
+
+# Cached result of probing ffmpeg for the NVENC encoder
+_NVENC_AVAILABLE = None
+
+
+def optional_import(name: str):
+    if name not in _optional_modules:
+        try:
+            _optional_modules[name] = importlib.import_module(name)
+        except ImportError:
+            _optional_modules[name] = None
+    return _optional_modules[name]
+
 
 def flush_memory():
-    print("🧹 Flushing memory caches…")
-    if torch:
+    # Let the caching allocator keep its blocks unless VRAM is actually tight.
+    # Nothing can be cached if torch was never imported or CUDA never initialised,
+    # so neither is forced here (mem_get_info would create a context).
+    torch = sys.modules.get("torch")
+    if not (torch and torch.cuda.is_initialized()):
+        return
+    free, total = torch.cuda.mem_get_info()
+    if free / total < VRAM_FLUSH_THRESHOLD:
+        print("🧹 Flushing memory caches…")
         torch.cuda.empty_cache()
-    gc.collect()
-    print("🔄 Memory flush complete\n")
+        print("🔄 Memory flush complete\n")
+
+
+def nvml_handle():
+    # Query the driver through NVML so stats never create a CUDA context
+    global _nvml_handle
+    if _nvml_handle is None:
+        _nvml_handle = False
+        pynvml = optional_import("pynvml")
+        if pynvml:
+            try:
+                pynvml.nvmlInit()
+                _nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            except pynvml.NVMLError:
+                pass
+    return _nvml_handle
 
 
 def show_stats():
     print("📊 Current resource usage:")
-    if torch:
-        alloc = torch.cuda.memory_allocated() / (1024 ** 3)
-        reserved = torch.cuda.memory_reserved() / (1024 ** 3)
-        print(f"   [GPU] Alloc: {alloc:.2f} GB | Resv: {reserved:.2f} GB")
+    handle = nvml_handle()
+    psutil = optional_import("psutil")
+    if handle:
+        mem = optional_import("pynvml").nvmlDeviceGetMemoryInfo(handle)
+        used = mem.used / (1024 ** 3)
+        total = mem.total / (1024 ** 3)
+        print(f"   [GPU] Used: {used:.2f} GB / {total:.2f} GB")
     if psutil:
         vm = psutil.virtual_memory()
         used = vm.used / (1024 ** 3)
@@ -70,6 +138,28 @@ def check_flashattention():
     print()
 
 
+def check_nvenc():
+    # A listed encoder only means ffmpeg was built with NVENC; a real one-frame
+    # encode shows the GPU and driver can actually use it
+    global _NVENC_AVAILABLE
+    if _NVENC_AVAILABLE is None:
+        _NVENC_AVAILABLE = False
+        # NVML is only a shortcut for "no NVIDIA GPU"; without pynvml, just probe
+        if nvml_handle() or not optional_import("pynvml"):
+            try:
+                probe = subprocess.run(
+                    ["ffmpeg", "-hide_banner", "-loglevel", "error",
+                     "-f", "lavfi", "-i", "color=s=256x256", "-frames:v", "1",
+                     "-c:v", "h264_nvenc", "-f", "null", "-"],
+                    capture_output=True,
+                    timeout=30,
+                )
+                _NVENC_AVAILABLE = probe.returncode == 0
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+    return _NVENC_AVAILABLE
+
+
 def load_wan_vace():
     print("🤖 Loading WAN-VACE model…")
     # TODO: replace with actual WAN-VACE load call
@@ -86,47 +176,58 @@ def prompt_item_indices(total: int):
             sys.exit(0)
         if resp == "all":
             return list(range(1, total + 1))
-        try:
-            picks = []
-            for part in resp.split(","):
-                if "-" in part:
-                    a, b = map(int, part.split("-", 1))
-                    picks.extend(range(a, b + 1))
-                else:
-                    picks.append(int(part))
-            valid = sorted({i for i in picks if 1 <= i <= total})
-            if valid:
-                return valid
-        except ValueError:
-            pass
+        picks = set()
+        for a, b in _SEL_RE.findall(resp):
+            a = int(a)
+            b = int(b) if b else a
+            # Clamp before expanding so a typo like 1-999999999 stays cheap
+            picks.update(range(max(min(a, b), 1), min(max(a, b), total) + 1))
+        valid = sorted(picks)
+        if valid:
+            return valid
         print("→ Invalid selection syntax. Try again.")
 
 
+def walk_images(root: Path):
+    # Filter raw names during traversal; only matches become Path objects
+    for dirpath, _, filenames in os.walk(root, followlinks=False):
+        for name in filenames:
+            # Same rule as Path.suffix: a leading dot (".png") is not a suffix
+            dot = name.rfind(".")
+            if dot > 0 and name[dot:] in IMAGE_EXTS_CI:
+                yield Path(dirpath, name)
+
+
 def prompt_image_selection(root_dir: Path):
+    listed_mtime = None
     while True:
-        entries = sorted(
-            root_dir.iterdir(),
-            key=lambda p: (not p.is_dir(), p.name.lower())
-        )
+        # Re-list only if the directory changed since the last attempt
+        mtime = root_dir.stat().st_mtime_ns
+        if mtime != listed_mtime:
+            listed_mtime = mtime
+            # Stat each entry once; the sort key and the listing share it
+            entries = sorted(
+                ((p, p.is_dir()) for p in root_dir.iterdir()),
+                key=lambda e: (not e[1], e[0].name.lower())
+            )
         if not entries:
             print("→ No subfolders or images found here. Returning.\n")
             return []
 
         print(f"\n🖼️ Available items in {root_dir}:")
-        for idx, p in enumerate(entries, start=1):
-            tag = "[DIR]" if p.is_dir() else "[IMG]"
-            print(f"  {idx:3}: {tag} {p.name}")
-        print()
+        lines = [
+            f"  {idx:3}: {'[DIR]' if is_dir else '[IMG]'} {p.name}"
+            for idx, (p, is_dir) in enumerate(entries, start=1)
+        ]
+        sys.stdout.write("\n".join(lines) + "\n\n")
 
         picks = prompt_item_indices(len(entries))
         selected = []
         for i in picks:
-            path = entries[i - 1]
-            if path.is_dir():
-                for img in sorted(path.rglob("*")):
-                    if img.suffix.lower() in IMAGE_EXTS:
-                        selected.append(img)
-            elif path.suffix.lower() in IMAGE_EXTS:
+            path, is_dir = entries[i - 1]
+            if is_dir:
+                selected.extend(walk_images(path))
+            elif path.suffix in IMAGE_EXTS_CI:
                 selected.append(path)
 
         if not selected:
@@ -145,6 +246,139 @@ def prompt_output():
     return path, fn
 
 
+def clear_dir(d: Path):
+    # Empty the directory in place rather than deleting and recreating it
+    d.mkdir(parents=True, exist_ok=True)
+    with os.scandir(d) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+def concat_codec(selected):
+    codecs = {FORMAT_CODECS[p.suffix.lower()] for p in selected}
+    # Mixed formats can't share one decoder, so they get piped as PNG instead
+    return codecs.pop() if len(codecs) == 1 else None
+
+
+def write_concat_list(selected, list_file: Path, fps: int):
+    duration = 1 / fps
+    lines = ["ffconcat version 1.0"]
+    for src in selected:
+        quoted = str(src.resolve()).replace("'", "'\\''")
+        lines += [f"file '{quoted}'", f"duration {duration:.6f}"]
+    # The concat demuxer ignores the last duration unless the file is repeated
+    lines.append(lines[-2])
+    list_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def png_frame(src: Path) -> bytes:
+    buf = BytesIO()
+    with Image.open(src) as img:
+        img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def feed_frames(proc, selected, errors: list):
+    try:
+        for src in selected:
+            proc.stdin.write(png_frame(src))
+    except BrokenPipeError:
+        # FFmpeg exited early; its return code reports the failure
+        pass
+    except Exception as e:
+        # Kill FFmpeg before stdin closes, or it would finish a truncated video
+        errors.append(e)
+        proc.kill()
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+
+
+def watch_progress(proc, tail: deque):
+    stats = {}
+    for raw in proc.stderr:
+        line = raw.decode(errors="replace").strip()
+        key, sep, value = line.partition("=")
+        if not sep or " " in key:
+            tail.append(line)
+            continue
+        stats[key] = value.strip()
+        if key == "progress":
+            print(
+                f"\r   frame={stats.get('frame', '0')} "
+                f"fps={stats.get('fps', '0')} speed={stats.get('speed', 'N/A')}   ",
+                end="",
+                flush=True,
+            )
+    print()
+
+
+def run_ffmpeg(cmd, frames=None):
+    # frames is only given for mixed selections streamed as PNG over stdin
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL if frames is None else subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0,
+    )
+    tail = deque(maxlen=20)
+    feed_errors = []
+    threads = [
+        threading.Thread(target=watch_progress, args=(proc, tail), daemon=True),
+    ]
+    if frames is not None:
+        threads.append(threading.Thread(
+            target=feed_frames, args=(proc, frames, feed_errors),
+            daemon=True,
+        ))
+    for t in threads:
+        t.start()
+    try:
+        proc.wait()
+    except KeyboardInterrupt:
+        print("\n🛑 Interrupted, stopping FFmpeg…")
+        proc.terminate()
+        proc.wait()
+        raise
+    for t in threads:
+        t.join()
+    if feed_errors:
+        raise feed_errors[0]
+    if proc.returncode != 0:
+        print("\n".join(tail))
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def notify(msg: str):
+    plyer = optional_import("plyer")
+    if not plyer:
+        print("🔔", msg)
+        return
+
+    def send():
+        try:
+            plyer.notification.notify(title="Render", message=msg, timeout=3)
+        except Exception:
+            print("🔔", msg)
+
+    # Don't hold up the next prompt on the notification backend
+    t = threading.Thread(target=send, daemon=True)
+    t.start()
+    _notify_threads.append(t)
+
+
+def wait_for_notifications(timeout: float = 5.0):
+    # Daemon threads die with the interpreter, so give pending sends a moment
+    for t in _notify_threads:
+        t.join(timeout)
+    _notify_threads.clear()
+
+
 def generate_narration(text: str, audio_path: Path):
     print("🗣️ Generating narration…")
     audio_path.write_bytes(b"")
@@ -152,46 +386,81 @@ def generate_narration(text: str, audio_path: Path):
 
 
 def build_ffmpeg_cmd(
-    image_pattern: str,
+    concat_list: Path,
     fps: int,
     zoom: float,
     padding: int,
     audio_path: Path,
     output_path: Path,
+    use_nvenc: bool = False,
 ):
-    cmd = ["ffmpeg", "-y", "-framerate", str(fps), "-i", image_pattern]
-    filters = []
-    if zoom != 1.0:
-        filters.append(f"zoompan=z='min(zoom+0.0005,{zoom})':d=1")
+    with_audio = ENABLE_TTS and audio_path and audio_path.exists()
+    cmd = ["ffmpeg", "-y", "-progress", "pipe:2", "-nostats",
+           "-thread_queue_size", "1024", "-fflags", "+genpts"]
+    if concat_list:
+        cmd += ["-f", "concat", "-safe", "0", "-i", str(concat_list)]
+    else:
+        # Codec and framerate are declared, so skip FFmpeg's input probing
+        cmd += ["-probesize", "32M", "-analyzeduration", "0",
+                "-f", "image2pipe", "-framerate", str(fps), "-c:v", "png",
+                "-i", "-"]
+    # All inputs must come before any output options
+    if with_audio:
+        cmd += ["-i", str(audio_path), "-shortest"]
+    if concat_list:
+        cmd += ["-vsync", "cfr", "-r", str(fps)]
+    # yuv420p needs even dims; drop the odd row/column up front
+    filters = ["scale=trunc(iw/2)*2:trunc(ih/2)*2:flags=neighbor"]
+    if zoom > 1.0 + 1e-6:
+        # pzoom carries the zoom across input frames instead of resetting it
+        filters.append(f"zoompan=z='min(pzoom+0.0005,{zoom})':d=1:fps={fps}")
     if padding > 0:
         filters.append(f"pad=iw+{padding*2}:ih+{padding*2}:{padding}:{padding}:black")
-    if filters:
-        cmd += ["-vf", ",".join(filters)]
-    if ENABLE_TTS and audio_path and audio_path.exists():
-        cmd += ["-i", str(audio_path), "-shortest"]
-    cmd += ["-c:v", "libx264", "-pix_fmt", "yuv420p"]
-    if ENABLE_TTS and audio_path and audio_path.exists():
+    cmd += ["-vf", ",".join(filters)]
+    if use_nvenc:
+        cmd += ["-c:v", "h264_nvenc", "-preset", "p4", "-tune", "hq",
+                "-rc", "vbr", "-cq", "23", "-pix_fmt", "yuv420p"]
+    else:
+        # -threads 0 lets x264 pick its own count (~1.5x logical cores)
+        cmd += ["-c:v", "libx264", "-preset", "ultrafast", "-tune", "stillimage",
+                "-threads", "0", "-x264-params", "sliced-threads=0",
+                "-pix_fmt", "yuv420p"]
+    if with_audio:
         cmd += ["-c:a", "aac"]
+    if output_path.suffix.lower() in (".mp4", ".m4v", ".mov"):
+        cmd += ["-movflags", "+faststart"]
     cmd.append(str(output_path))
     return cmd
 
 
-def main():
-    print("\n=== Persistent Image-to-Video Renderer ===\n")
-    print("🎥 Keeps WAN-VACE loaded in a loop")
-    print("✨ Text-prompt or Image-dir workflows")
-    print("🗣️ On-the-fly Coqui TTS narration in Text mode (currently disabled)")
-    print("📊 Live CPU/RAM & GPU/VRAM stats")
-    print("🧹 Memory flushes before/after renders")
-    print("🩺 FlashAttention health-check")
-    print("🎞️ Auto-pad to even dims, mux audio/video")
-    print("🔣 Numbered prompt picker")
-    print("🚪 Explicit quit options")
-    print("🔔 Beep when render completes\n")
-
-    model = load_wan_vace()
-    check_flashattention()
-
+def render(selected, output_path: Path, fps: int, zoom: float, padding: int,
+           audio_file: Path = None):
+    codec = concat_codec(selected)
+    concat_list = None
+    if codec:
+        # Same-format frames are read by FFmpeg in place via a concat list
+        temp_dir = output_path.parent / "temp_images"
+        clear_dir(temp_dir)
+        concat_list = temp_dir / "concat.txt"
+        write_concat_list(selected, concat_list, fps)
+    cmd = build_ffmpeg_cmd(
+        concat_list, fps, zoom, padding, audio_file, output_path,
+        use_nvenc=check_nvenc(),
+    )
+
+    print("\n🎬 Running FFmpeg:")
+    print("  " + " ".join(cmd) + "\n")
+    if concat_list:
+        run_ffmpeg(cmd)
+    else:
+        run_ffmpeg(cmd, selected)
+
+    notify(f"{output_path} done")
+    print(f"✅ Video saved to {output_path}\n")
+    return output_path
+
+
+def interactive(model):
     while True:
         flush_memory()
         show_stats()
@@ -204,8 +473,7 @@ def main():
             prompt = input("✍️ Enter scene description text: ").strip()
             print(f"→ Generating images for: “{prompt}”")
             img_root = Path("./temp_images")
-            shutil.rmtree(img_root, ignore_errors=True)
-            img_root.mkdir()
+            clear_dir(img_root)
             # TODO: model.generate_images(prompt) → img_root
             selected = prompt_image_selection(img_root)
 
@@ -217,16 +485,11 @@ def main():
 
         print(f"\n✅ You selected {len(selected)} images.\n")
 
-        out_dir, base_name = prompt_output()
-        temp_dir = out_dir / "temp_images"
-        shutil.rmtree(temp_dir, ignore_errors=True)
-        temp_dir.mkdir()
+        if concat_codec(selected) is None and Image is None:
+            print("→ Mixed image formats need Pillow to transcode. Try again.\n")
+            continue
 
-        print("📋 Copying and renaming images…")
-        for i, src in enumerate(selected, start=1):
-            dst = temp_dir / f"{i:06d}{src.suffix}"
-            shutil.copy(src, dst)
-        print("✅ Image copy complete\n")
+        out_dir, base_name = prompt_output()
 
         audio_file = None
         if ENABLE_TTS:
@@ -236,7 +499,7 @@ def main():
                 generate_narration(txt, audio_file)
 
         fps = input("⏱️ FPS [24]: ").strip()
-        fps = int(fps) if fps.isdigit() else 24
+        fps = int(fps) if fps.isdigit() and int(fps) > 0 else 24
 
         zoom = input("🔍 Max zoom factor [1.0]: ").strip()
         try:
@@ -247,23 +510,145 @@ def main():
         padd = input("➕ Padding (px) [0]: ").strip()
         padding = int(padd) if padd.isdigit() else 0
 
-        output_path = out_dir / f"{base_name}.mp4"
-        pattern = str(temp_dir / "%06d" + selected[0].suffix)
-        cmd = build_ffmpeg_cmd(pattern, fps, zoom, padding, audio_file, output_path)
-
-        print("\n🎬 Running FFmpeg:")
-        print("  " + " ".join(cmd) + "\n")
-        subprocess.run(cmd, check=True)
-
-        print("🔔 Render complete!\a")
-        print(f"✅ Video saved to {output_path}\n")
+        render(selected, out_dir / f"{base_name}.mp4", fps, zoom, padding, audio_file)
 
-        flush_memory()
         again = input("↩️ Render another? [y/N]: ").strip().lower()
         if again != "y":
+            gc.collect()
             print("\n🚪 Goodbye!\n")
             break
 
 
+def positive_int(value) -> int:
+    n = int(value)
+    if n <= 0:
+        raise ValueError(f"must be a positive integer, got {value!r}")
+    return n
+
+
+def load_jobs(batch_file: Path):
+    is_yaml = batch_file.suffix.lower() in (".yaml", ".yml")
+    yaml = optional_import("yaml") if is_yaml else None
+    if is_yaml and not yaml:
+        sys.exit("→ YAML job files need PyYAML installed.")
+    parse_errors = (OSError, ValueError) + ((yaml.YAMLError,) if yaml else ())
+    try:
+        text = batch_file.read_text(encoding="utf-8")
+        jobs = (yaml.safe_load(text) or []) if yaml else json.loads(text)
+    except parse_errors as e:
+        sys.exit(f"→ Could not read job file {batch_file}: {e}")
+    if not isinstance(jobs, list):
+        sys.exit(f"→ Job file {batch_file} must contain a list of jobs.")
+    return jobs
+
+
+def parse_job(job):
+    if not isinstance(job, dict):
+        raise ValueError(f"expected a mapping, got {type(job).__name__}")
+    if "images_dir" not in job:
+        raise ValueError("missing 'images_dir'")
+    try:
+        images_dir = Path(job["images_dir"])
+        output = Path(job.get("output", "output/rendered_video.mp4")).expanduser()
+    except TypeError as e:
+        raise ValueError(f"bad images_dir/output: {e}") from None
+    if not output.suffix:
+        output = output.with_suffix(".mp4")
+    try:
+        fps = positive_int(job.get("fps", 24))
+        zoom = float(job.get("zoom", 1.0))
+        padding = int(job.get("padding", 0))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"bad fps/zoom/padding: {e}") from None
+    return images_dir, output, fps, zoom, padding
+
+
+def run_batch(jobs):
+    for n, job in enumerate(jobs, start=1):
+        try:
+            images_dir, output, fps, zoom, padding = parse_job(job)
+        except ValueError as e:
+            print(f"\n→ Job {n}/{len(jobs)} is invalid ({e}). Skipping.\n")
+            continue
+        print(f"\n📦 Job {n}/{len(jobs)}: {images_dir}")
+        flush_memory()
+        selected = sorted(walk_images(images_dir), key=str)
+        if not selected:
+            print("→ No images found. Skipping.\n")
+            continue
+        if concat_codec(selected) is None and Image is None:
+            print("→ Mixed image formats need Pillow to transcode. Skipping.\n")
+            continue
+        output.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            render(selected, output, fps, zoom, padding)
+        except subprocess.CalledProcessError as e:
+            print(f"→ FFmpeg failed with exit code {e.returncode}. Skipping.\n")
+        except OSError as e:
+            print(f"→ Render failed ({e}). Skipping.\n")
+    gc.collect()
+
+
+def arg_positive_int(value: str) -> int:
+    try:
+        return positive_int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render image directories to video, keeping the model loaded."
+    )
+    parser.add_argument("--images-dir", type=Path, help="directory of input images")
+    parser.add_argument("--output", type=Path, default=Path("output/rendered_video.mp4"),
+                        help="output video path; its suffix picks the container "
+                             "(default: %(default)s)")
+    parser.add_argument("--fps", type=arg_positive_int, default=24)
+    parser.add_argument("--zoom", type=float, default=1.0, help="max zoom factor")
+    parser.add_argument("--padding", type=int, default=0, help="padding in px")
+    parser.add_argument("--batch", type=Path,
+                        help="JSON or YAML list of jobs with the same keys as above")
+    args = parser.parse_args(argv)
+    if args.batch is None and args.images_dir is None:
+        parser.error("one of --images-dir or --batch is required")
+    return args
+
+
+def main():
+    # No arguments keeps the interactive TTY workflow
+    args = parse_args() if len(sys.argv) > 1 else None
+
+    print("\n=== Persistent Image-to-Video Renderer ===\n")
+    print("🎥 Keeps WAN-VACE loaded in a loop")
+    print("✨ Text-prompt or Image-dir workflows")
+    print("🗣️ On-the-fly Coqui TTS narration in Text mode (currently disabled)")
+    print("📊 Live CPU/RAM & GPU/VRAM stats")
+    print("🧹 Memory flushes before renders when VRAM runs low")
+    print("🩺 FlashAttention health-check")
+    print("🎞️ Auto-pad to even dims, mux audio/video")
+    print("🔣 Numbered prompt picker")
+    print("🚪 Explicit quit options")
+    print("🔔 Desktop notification when render completes")
+    print("📦 Unattended batch mode (--images-dir / --batch jobs.json)\n")
+
+    model = load_wan_vace()
+    check_flashattention()
+
+    if args is None:
+        interactive(model)
+    elif args.batch:
+        run_batch(load_jobs(args.batch))
+    else:
+        run_batch([{
+            "images_dir": args.images_dir,
+            "output": args.output,
+            "fps": args.fps,
+            "zoom": args.zoom,
+            "padding": args.padding,
+        }])
+    wait_for_notifications()
+
+
 if __name__ == "__main__":
     main()